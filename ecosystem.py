@@ -11,10 +11,9 @@ Responsibilities:
 """
 
 import random
+import sys
 import time
-from organisms import Plant, Herbivore, Carnivore, PLANT_SYMBOL
-
-random.seed(42)  # For reproducibility during testing
+from organisms import Plant, Herbivore, Carnivore, PLANT_SYMBOL, HERBIVORE_SYMBOL, CARNIVORE_SYMBOL
 
 # General constants
 CELL_WIDTH = 2
@@ -22,27 +21,38 @@ EMPTY_SYMBOL = '.'
 DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1)]
 TICK_DELAY = 1
 
+# Rendered text of each possible cell, computed once.
+# Empty and Plant cells get extra space for alignment, since the animal emojis are double width.
+CENTERED_CELLS = {sym: sym.center(CELL_WIDTH) + (' ' if sym in (EMPTY_SYMBOL, PLANT_SYMBOL) else '')
+                  for sym in (EMPTY_SYMBOL, PLANT_SYMBOL, HERBIVORE_SYMBOL, CARNIVORE_SYMBOL)}
+
 class Ecosystem:
     """Class representing the ecosystem simulation, including the 2D grid and the loop."""
 
-    def __init__(self, width:int, height:int, initial_plants:int, initial_herbivores:int, initial_carnivores:int, total_ticks:int):
+    def __init__(self, width:int, height:int, initial_plants:int, initial_herbivores:int, initial_carnivores:int, total_ticks:int, tick_delay:float=0, seed=None):
         # Initialize ecosystem parameters
         self.width = width
         self.height = height
+        self.rng = random.Random(seed) # Private random source shared with organisms; pass a seed for reproducible runs
         self.organisms = []
+        self.cells = {} # Spatial hash: (x, y) -> list of organisms in that cell
+        self.by_type = {Plant: set(), Herbivore: set(), Carnivore: set()} # Living organisms indexed by class
+        # Neighbour lists never change on a fixed grid, so build them once: (x, y) -> tuple of adjacent cells
+        self.adj = {(x, y): tuple((x + dx, y + dy) for dx, dy in DIRECTIONS if 0 <= x + dx < width and 0 <= y + dy < height)
+                    for x in range(width) for y in range(height)}
         self.total_ticks = total_ticks
-        self.initial_helper_set = set() # Only used during initial population to avoid overlaps
+        self.tick_delay = tick_delay # Seconds to pause between ticks; 0 runs headless at full speed
+        self.initial_empty_cells = [(x, y) for x in range(width) for y in range(height)] # Only used during initial population to avoid overlaps
         #self.generation = 0
 
         # Populate initial organisms
         self.populate(Plant, initial_plants)
         self.populate(Herbivore, initial_herbivores)
         self.populate(Carnivore, initial_carnivores)
-        self.initial_helper_set.clear()
+        self.initial_empty_cells.clear()
 
-        # Temporary queue for new born and dead organisms during updates
+        # Temporary queue for new born organisms during updates (deaths are swept via the alive flag)
         self.temp_added_organisms = []
-        self.temp_removed_organisms = []
 
         # Display initial state
         print("Ecosystem simulation starting...")
@@ -54,62 +64,84 @@ class Ecosystem:
     def populate(self, organism_class, count):
         """Populate the ecosystem with a given number of organisms of a specific class."""
         for _ in range(count):
-            (x, y) = self.random_empty_cell()
-            if (x, y):
+            cell = self.random_empty_cell()
+            if cell:
+                (x, y) = cell
                 organism = organism_class(x, y)
                 self.organisms.append(organism)
+                self.cells.setdefault((x, y), []).append(organism)
+                self.by_type[organism_class].add(organism)
 
     def random_empty_cell(self):
-        """Return a single empty cell in the grid."""
-        while True:
-            x, y = random.randint(0, self.width-1), random.randint(0, self.height-1)
-            if (x, y) not in self.initial_helper_set:
-                self.initial_helper_set.add((x, y))
-                return (x, y)
+        """Return a single empty cell in the grid, or None if the grid is full."""
+        empty = self.initial_empty_cells
+        if not empty:
+            return None
+        # Swap the chosen cell to the end and pop it, so each pick is O(1) regardless of fill ratio
+        i = self.rng.randrange(len(empty))
+        empty[i], empty[-1] = empty[-1], empty[i]
+        return empty.pop()
             
     # Define the helper functions for organism interactions below.
     def get_organism_at(self, x, y):
         """Return a specific organism at (x, y)."""
-        return [org for org in self.organisms + self.temp_added_organisms if org.x == x and org.y == y and org.alive]
+        return [org for org in self.cells.get((x, y), ()) if org.alive]
 
 
     def get_adjacent_cells(self, x, y):
-        """Return a list of valid adjacent cells around (x, y)."""
-        adjacent = []
-        for dx, dy in DIRECTIONS:
-            nx, ny = x + dx, y + dy
-            if 0 <= nx < self.width and 0 <= ny < self.height:
-                adjacent.append((nx, ny))
-        return adjacent
+        """Return a tuple of valid adjacent cells around (x, y)."""
+        return self.adj[(x, y)]
     
     def get_adjacent_empty_cells(self, x, y):
         """Return a list of adjacent empty cells around (x, y)."""
+        cells = self.cells
+        return [cell for cell in self.get_adjacent_cells(x, y) if not cells.get(cell)]
+
+    def random_empty_neighbor(self, x, y):
+        """Return one uniformly random adjacent empty cell around (x, y), or None if there is none."""
         adjacent = self.get_adjacent_cells(x, y)
-        return [(nx, ny) for (nx, ny) in adjacent if not self.get_organism_at(nx, ny)]
+        if not adjacent:
+            return None
+        # Probe one random neighbour first; only build the full empty list if it is occupied.
+        cell = self.rng.choice(adjacent)
+        if not self.cells.get(cell):
+            return cell
+        empty_cells = self.get_adjacent_empty_cells(x, y)
+        return self.rng.choice(empty_cells) if empty_cells else None
     
     def get_adjacent_organisms(self, x, y, target_organism_type):
         """Return a list of adjacent organisms around (x, y) by type."""
-        adjacent = self.get_adjacent_cells(x, y)
-        result = []
-        for (nx, ny) in adjacent:
-            for org in self.organisms + self.temp_added_organisms:
-                if org.x == nx and org.y == ny and isinstance(org, target_organism_type) and org.alive:
-                    result.append(org)
-        return result
+        cells = self.cells
+        return [org for cell in self.get_adjacent_cells(x, y) for org in cells.get(cell, ())
+                if type(org) is target_organism_type and org.alive]
     
     def add_organism(self, organism):
         """Add a new organism to the ecosystem."""
         self.temp_added_organisms.append(organism)
+        self.cells.setdefault((organism.x, organism.y), []).append(organism)
+        self.by_type[type(organism)].add(organism)
     
     def remove_organism(self, organism):
         """Remove an organism from the ecosystem."""
         organism.alive = False
-        self.temp_removed_organisms.append(organism)
+        self._leave_cell(organism)
+        self.by_type[type(organism)].discard(organism)
 
     def move_organism(self, organism, new_x, new_y):
         """Move an organism to a new position."""
+        self._leave_cell(organism)
         organism.x = new_x
         organism.y = new_y
+        self.cells.setdefault((new_x, new_y), []).append(organism)
+
+    def _leave_cell(self, organism):
+        """Drop an organism from the spatial hash entry of its current cell."""
+        key = (organism.x, organism.y)
+        occupants = self.cells.get(key)
+        if occupants and organism in occupants:
+            occupants.remove(organism)
+            if not occupants:
+                del self.cells[key]
 
     # Main simulation loop and display functions
     def run(self):
@@ -124,60 +156,49 @@ class Ecosystem:
             tick += 1
 
             # Shuffle and copy organism list to avoid modification during iteration
-            organisms = self.organisms.copy()
-            random.shuffle(organisms)
+            organisms = self.organisms[:]
+            self.rng.shuffle(organisms)
             
             # Update each organism
-            for org in list(organisms):
+            for org in organisms:
                 if org.alive:
                     org.update(self)
 
-            # Process births and deaths after all updates
+            # Process births and deaths after all updates in one sweep over the alive flag
             # Notice that newly born organisms might also be eaten in the same tick
-            for org in self.temp_added_organisms:
-                if org.alive:
-                    self.organisms.append(org)
-
-
-            for org in self.temp_removed_organisms:
-                if org in self.organisms:
-                    self.organisms.remove(org)
+            self.organisms = [org for org in self.organisms if org.alive] + [org for org in self.temp_added_organisms if org.alive]
             self.temp_added_organisms.clear()
-            self.temp_removed_organisms.clear()
 
             # Display the current state of the ecosystem
             self.display(tick)
 
             # Delay for visualization
-            time.sleep(TICK_DELAY)
+            if self.tick_delay > 0:
+                time.sleep(self.tick_delay)
     
     def display(self, tick):
         """Display the current state of the ecosystem grid in aligned columns."""
 
-        # Create empty grid
-        grid = [[EMPTY_SYMBOL for _ in range(self.width)] for _ in range(self.height)]
-
-        # Place organisms in the grid
-        for org in self.organisms:
-            if org.alive:
-                grid[org.y][org.x] = org.symbol
-
-        # Display summary statistics
-        print(f"Tick: {tick}, "
-            f"Plants: {sum(isinstance(o, Plant) and o.alive for o in self.organisms)}, "
-            f"Herbivores: {sum(isinstance(o, Herbivore) and o.alive for o in self.organisms)}, "
-            f"Carnivores: {sum(isinstance(o, Carnivore) and o.alive for o in self.organisms)}")
-
-        # Display the grid with aligned columns
-        for row in grid:
-            for cell in row:
-                if cell == EMPTY_SYMBOL or cell == PLANT_SYMBOL: # Empty and Plant cells get extra space for alignment
-                    print(cell.center(CELL_WIDTH), end=' ')
-                else:
-                    print(cell.center(CELL_WIDTH), end='')
-            print()
+        # Create empty grid of rendered cells
+        grid = [[CENTERED_CELLS[EMPTY_SYMBOL]] * self.width for _ in range(self.height)]
 
-        print("\n" + "=" * (self.width * (CELL_WIDTH+1)) + "\n")
+        # Place organisms in the grid straight from the spatial hash, which only holds living organisms
+        for (x, y), occupants in self.cells.items():
+            grid[y][x] = CENTERED_CELLS[occupants[-1].symbol]
+
+        # Summary statistics (by_type is kept up to date on every add/remove, so no scan is needed)
+        lines = [f"Tick: {tick}, "
+                 f"Plants: {len(self.by_type[Plant])}, "
+                 f"Herbivores: {len(self.by_type[Herbivore])}, "
+                 f"Carnivores: {len(self.by_type[Carnivore])}"]
+
+        # Grid with aligned columns
+        lines.extend(''.join(row) for row in grid)
+
+        lines.append("\n" + "=" * (self.width * (CELL_WIDTH+1)) + "\n\n")
+
+        # Write the whole frame at once instead of one print() per cell
+        sys.stdout.write('\n'.join(lines))
 
     
 
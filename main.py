@@ -8,7 +8,7 @@ Handles:
 - Running the simulation
 
 """
-from ecosystem import Ecosystem
+from ecosystem import Ecosystem, TICK_DELAY
 
 def get_simulation_parameters():
     """
@@ -77,7 +77,7 @@ def get_positive_integer(prompt, allow_zero=False):
 def main():
     """Get parameters, initialize ecosystem, and run simulation."""
     width, height, plants, herbivores, carnivores, ticks = get_simulation_parameters()
-    ecosystem = Ecosystem(width, height, plants, herbivores, carnivores, ticks)
+    ecosystem = Ecosystem(width, height, plants, herbivores, carnivores, ticks, tick_delay=TICK_DELAY)
     ecosystem.run()
     print("Simulation ended.")
 
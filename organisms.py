@@ -10,7 +10,6 @@ The structure follows an OOP hierarchy:
     - Carnivore
 """
 
-import random
 from abc import ABC, abstractmethod
 
 
@@ -42,6 +41,8 @@ CARNIVORE_CHILD_ENERGY = 20
 class Organism(ABC):
     """Base class for all organisms in the ecosystem."""
 
+    __slots__ = ('x', 'y', 'symbol', 'alive') # No per-instance __dict__; subclasses declare their own slots
+
     def __init__(self, x:int, y:int, symbol:str):
         self.x = x
         self.y = y
@@ -56,21 +57,25 @@ class Organism(ABC):
 class Plant(Organism):
     """Class representing a plant in the ecosystem."""
 
+    __slots__ = ()
+
     def __init__(self, x:int, y:int):
         super().__init__(x, y, PLANT_SYMBOL)
 
     def update(self, ecosystem):
         """Plants try to reproduce based on chance."""
-        if random.random() < PLANT_REPRODUCTION_CHANCE:
-            empty_cells = ecosystem.get_adjacent_empty_cells(self.x, self.y)
-            if empty_cells:
-                new_x, new_y = random.choice(empty_cells)
+        if ecosystem.rng.random() < PLANT_REPRODUCTION_CHANCE:
+            empty_cell = ecosystem.random_empty_neighbor(self.x, self.y)
+            if empty_cell:
+                new_x, new_y = empty_cell
                 new_plant = Plant(new_x, new_y)
                 ecosystem.add_organism(new_plant)
 
 class Animal(Organism, ABC):
     """Base class for all animals in the ecosystem."""
 
+    __slots__ = ('energy',)
+
     def __init__(self, x:int, y:int, symbol:str, initial_energy:int):
         super().__init__(x, y, symbol)
         self.energy = initial_energy
@@ -82,16 +87,16 @@ class Animal(Organism, ABC):
     # Define common animal behaviors below.
     def move(self, ecosystem):
         """Move to a random adjacent empty cell."""
-        empty_cells = ecosystem.get_adjacent_empty_cells(self.x, self.y)
-        if empty_cells:
-            new_x, new_y = random.choice(empty_cells)
+        empty_cell = ecosystem.random_empty_neighbor(self.x, self.y)
+        if empty_cell:
+            new_x, new_y = empty_cell
             ecosystem.move_organism(self, new_x, new_y)
 
     def eat(self, ecosystem, prey_class, eat_gain):
         """Try to eat a prey organism in adjacent cells."""
         prey_list = ecosystem.get_adjacent_organisms(self.x, self.y, prey_class)
         if prey_list:
-            prey = random.choice(prey_list)
+            prey = ecosystem.rng.choice(prey_list)
             ecosystem.move_organism(self, prey.x, prey.y)
             ecosystem.remove_organism(prey)
             self.energy += eat_gain
@@ -100,10 +105,10 @@ class Animal(Organism, ABC):
     
     def reproduce(self, ecosystem, reproduction_energy_threshold, reproduction_chance, reproduction_cost, child_class, child_energy):
         """Try to reproduce if energy and chance conditions are met."""
-        if self.energy >= reproduction_energy_threshold and random.random() < reproduction_chance:
-            empty_cells = ecosystem.get_adjacent_empty_cells(self.x, self.y)
-            if empty_cells:
-                new_x, new_y = random.choice(empty_cells)
+        if self.energy >= reproduction_energy_threshold and ecosystem.rng.random() < reproduction_chance:
+            empty_cell = ecosystem.random_empty_neighbor(self.x, self.y)
+            if empty_cell:
+                new_x, new_y = empty_cell
                 new_child = child_class(new_x, new_y)
                 new_child.energy = child_energy
                 ecosystem.add_organism(new_child)
@@ -121,6 +126,8 @@ class Animal(Organism, ABC):
 class Herbivore(Animal):
     """Class representing a herbivore in the ecosystem."""
 
+    __slots__ = ()
+
     def __init__(self, x:int, y:int):
         super().__init__(x, y, HERBIVORE_SYMBOL, HERBIVORE_INITIAL_ENERGY)
 
@@ -131,12 +138,9 @@ class Herbivore(Animal):
         super().update(ecosystem)
 
         # 2. Try to act (eat, reproduce, move) in order.
-        acted = False
-        if not acted and self.eat(ecosystem, Plant, HERBIVORE_EAT_GAIN):
-            acted = True
-        if not acted and self.reproduce(ecosystem, HERBIVORE_REPRODUCTION_ENERGY_THRESHOLD, HERBIVORE_REPRODUCTION_CHANCE, HERBIVORE_REPRODUCTION_COST, Herbivore, HERBIVORE_CHILD_ENERGY):
-            acted = True
-        if not acted:
+        # Each step only runs if the previous one did not act.
+        if not (self.eat(ecosystem, Plant, HERBIVORE_EAT_GAIN)
+                or self.reproduce(ecosystem, HERBIVORE_REPRODUCTION_ENERGY_THRESHOLD, HERBIVORE_REPRODUCTION_CHANCE, HERBIVORE_REPRODUCTION_COST, Herbivore, HERBIVORE_CHILD_ENERGY)):
             self.move(ecosystem)
 
         # 3. Check survival
@@ -145,6 +149,8 @@ class Herbivore(Animal):
 class Carnivore(Animal):
     """Class representing a carnivore in the ecosystem."""
 
+    __slots__ = ()
+
     def __init__(self, x:int, y:int):
         super().__init__(x, y, CARNIVORE_SYMBOL, CARNIVORE_INITIAL_ENERGY)
 
@@ -155,12 +161,9 @@ class Carnivore(Animal):
         super().update(ecosystem)
 
         # 2. Try to act (eat, reproduce, move) in order.
-        acted = False
-        if not acted and  self.eat(ecosystem, Herbivore, CARNIVORE_EAT_GAIN):
-            acted = True
-        if not acted and self.reproduce(ecosystem, CARNIVORE_REPRODUCTION_ENERGY_THRESHOLD, CARNIVORE_REPRODUCTION_CHANCE, CARNIVORE_REPRODUCTION_COST, Carnivore, CARNIVORE_CHILD_ENERGY):
-            acted = True
-        if not acted:
+        # Each step only runs if the previous one did not act.
+        if not (self.eat(ecosystem, Herbivore, CARNIVORE_EAT_GAIN)
+                or self.reproduce(ecosystem, CARNIVORE_REPRODUCTION_ENERGY_THRESHOLD, CARNIVORE_REPRODUCTION_CHANCE, CARNIVORE_REPRODUCTION_COST, Carnivore, CARNIVORE_CHILD_ENERGY)):
             self.move(ecosystem)
 
         # 3. Check survival